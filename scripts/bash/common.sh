@@ -292,6 +292,153 @@ make_scripts_executable() {
     find "$scripts_dir" -name "*.sh" -type f -exec make_executable {} \;
 }
 
+# Shared .intent/ state helpers
+#
+# Several agents or CI jobs may run these scripts against one checkout, so
+# artifacts are never written in place: content goes to a temporary file in
+# the same directory and is renamed over the target. Read-modify-write steps
+# hold a per-artifact advisory lock under .intent/.locks/ (the same lock files
+# the intent CLI uses), and an artifact's version is the sha256 of its
+# content, so a writer can refuse to clobber changes it has not seen.
+
+# Function to get the lock file guarding an artifact
+intent_lock_file() {
+    local target="$1"
+    local dir name root=""
+    dir="$(dirname "$target")"
+    name="$(basename "$target")"
+    if [ -d "$dir" ]; then
+        dir="$(cd "$dir" && pwd -P)"
+    else
+        case "$dir" in /*) ;; *) dir="$(pwd -P)/$dir" ;; esac
+    fi
+    target="$dir/$name"
+
+    # Same root rule as the intent CLI: nearest ancestor holding .intent/ or .git
+    while :; do
+        if [ -d "$dir/.intent" ] || [ -e "$dir/.git" ]; then
+            root="$dir"
+            break
+        fi
+        [ "$dir" = "/" ] && break
+        dir="$(dirname "$dir")"
+    done
+
+    if [ -z "$root" ]; then
+        # Outside any project: lock beside the file rather than creating a stray .intent/
+        echo "$(dirname "$target")/.$name.lock"
+        return
+    fi
+    local rel="${target#"${root%/}"/}"
+    echo "${root%/}/.intent/.locks/$(printf '%s' "$rel" | tr -c 'A-Za-z0-9._-' '_').lock"
+}
+
+# Function to run a command while holding an artifact's lock
+# Uses flock(1) when available, otherwise an atomic mkdir lock
+with_file_lock() {
+    local target="$1"
+    shift
+    local lock_file
+    lock_file="$(intent_lock_file "$target")"
+    mkdir -p "$(dirname "$lock_file")"
+
+    if command_exists flock; then
+        (
+            flock 9
+            "$@"
+        ) 9>"$lock_file"
+        return $?
+    fi
+
+    local lock_dir="$lock_file.d"
+    local timeout="${INTENT_LOCK_TIMEOUT:-30}"
+    local waited=0
+    until mkdir "$lock_dir" 2>/dev/null; do
+        if [ "$waited" -ge $((timeout * 10)) ]; then
+            print_error "Timed out waiting for lock on $target (remove $lock_dir if no other job is running)"
+            return 1
+        fi
+        sleep 0.1
+        waited=$((waited + 1))
+    done
+    local status=0
+    "$@" || status=$?
+    rmdir "$lock_dir"
+    return $status
+}
+
+# Function to write stdin to a file atomically (temp file + rename)
+write_file_atomic() {
+    local dest="$1"
+    local tmp
+    tmp="$(mktemp "$(dirname "$dest")/.$(basename "$dest").XXXXXX")" || return 1
+    if ! cat > "$tmp"; then
+        rm -f "$tmp"
+        return 1
+    fi
+    chmod "$(printf '%o' $((0666 & ~$(umask))))" "$tmp"
+    mv -f "$tmp" "$dest"
+}
+
+# Function to copy a file atomically
+copy_file_atomic() {
+    local src="$1"
+    local dest="$2"
+    write_file_atomic "$dest" < "$src"
+}
+
+# Function to create an empty file unless it already exists (atomic replacement for touch)
+create_file_if_missing() {
+    local dest="$1"
+    ( set -o noclobber; : > "$dest" ) 2>/dev/null || true
+}
+
+_write_file_if_missing_locked() {
+    local dest="$1"
+    [ -e "$dest" ] && return 0
+    write_file_atomic "$dest"
+}
+
+# Function to write stdin to a file only if it does not exist yet (no-op otherwise)
+write_file_if_missing() {
+    local dest="$1"
+    with_file_lock "$dest" _write_file_if_missing_locked "$dest"
+}
+
+# Function to get an artifact's version (sha256 of its content, or "none" if missing)
+artifact_version() {
+    local file="$1"
+
+    if [ ! -f "$file" ]; then
+        echo "none"
+    elif command_exists sha256sum; then
+        sha256sum "$file" | cut -d' ' -f1
+    else
+        shasum -a 256 "$file" | cut -d' ' -f1
+    fi
+}
+
+_write_file_if_version_locked() {
+    local dest="$1"
+    local expected="$2"
+    local current
+    current="$(artifact_version "$dest")"
+
+    if [ "$current" != "$expected" ]; then
+        print_error "$dest was changed by another process (expected version $expected, found $current)"
+        return 3
+    fi
+    write_file_atomic "$dest"
+}
+
+# Function to write stdin to a file only if it is still at the expected version
+# Pass "none" to create a file only if it does not exist yet. Returns 3 on conflict.
+write_file_if_version() {
+    local dest="$1"
+    local expected="$2"
+    with_file_lock "$dest" _write_file_if_version_locked "$dest" "$expected"
+}
+
 # Export functions so they can be used by other scripts
 export -f print_info
 export -f print_success
@@ -310,4 +457,14 @@ export -f confirm_action
 export -f check_directory
 export -f setup_git_repo
 export -f make_executable
-export -f make_scripts_executable
\ No newline at end of file
+export -f make_scripts_executable
+export -f intent_lock_file
+export -f with_file_lock
+export -f write_file_atomic
+export -f copy_file_atomic
+export -f create_file_if_missing
+export -f _write_file_if_missing_locked
+export -f write_file_if_missing
+export -f artifact_version
+export -f _write_file_if_version_locked
+export -f write_file_if_version
\ No newline at end of file
@@ -89,22 +89,26 @@ else
     BRANCH_SUFFIX=$(generate_branch_name "$FEATURE_DESCRIPTION")
 fi
 
-# Determine branch number
-if [ -z "$BRANCH_NUMBER" ]; then
-    if is_git_repo; then
-        # Check existing branches on remotes
-        BRANCH_NUMBER=$(get_next_feature_number "$INTENTS_DIR")
-    else
-        # Fall back to local directory check
-        BRANCH_NUMBER=$(get_next_feature_number "$INTENTS_DIR")
+# Allocate the feature number and claim its directory while holding the
+# intents/ lock, so parallel runs never pick the same number
+claim_feature_dir() {
+    local number="$1"
+    if [ -z "$number" ]; then
+        number=$(get_next_feature_number "$INTENTS_DIR")
     fi
-fi
 
-FEATURE_NUM=$(format_feature_number "$BRANCH_NUMBER")
-BRANCH_NAME="${FEATURE_NUM}-${BRANCH_SUFFIX}"
+    local branch_name
+    branch_name="$(format_feature_number "$number")-${BRANCH_SUFFIX}"
+
+    # Validate branch name length
+    branch_name=$(validate_branch_name "$branch_name")
+
+    mkdir -p "$INTENTS_DIR/$branch_name"
+    echo "$branch_name"
+}
 
-# Validate branch name length
-BRANCH_NAME=$(validate_branch_name "$BRANCH_NAME")
+BRANCH_NAME=$(with_file_lock "$INTENTS_DIR" claim_feature_dir "$BRANCH_NUMBER")
+FEATURE_NUM="${BRANCH_NAME%%-*}"
 
 # Create and checkout branch if in git repo
 if is_git_repo; then
@@ -121,10 +125,10 @@ mkdir -p "$FEATURE_DIR"
 TEMPLATE="$REPO_ROOT/.intent/templates/Intent-template.md"
 SPEC_FILE="$FEATURE_DIR/Intent.md"
 if [ -f "$TEMPLATE" ]; then
-    cp "$TEMPLATE" "$SPEC_FILE"
+    copy_file_atomic "$TEMPLATE" "$SPEC_FILE"
     print_success "Created specification template: $SPEC_FILE"
 else
-    touch "$SPEC_FILE"
+    create_file_if_missing "$SPEC_FILE"
     print_warning "Template not found, created empty Intent file: $SPEC_FILE"
 fi
 
@@ -75,7 +75,7 @@ fi
 if [ ! -f "$FEATURE_DIR/Intent.md" ]; then
     print_warning "Intent.md not found in $FEATURE_DIR"
     print_info "Creating placeholder Intent.md..."
-    touch "$FEATURE_DIR/Intent.md"
+    create_file_if_missing "$FEATURE_DIR/Intent.md"
 fi
 
 # Create research directory
@@ -94,10 +94,10 @@ if [ ! -f "$TEMPLATE" ]; then
 fi
 
 if [ -f "$TEMPLATE" ]; then
-    cp "$TEMPLATE" "$RESEARCH_FILE"
+    copy_file_atomic "$TEMPLATE" "$RESEARCH_FILE"
     print_success "Created research document from template: $RESEARCH_FILE"
 else
-    touch "$RESEARCH_FILE"
+    create_file_if_missing "$RESEARCH_FILE"
     print_warning "Research template not found, created empty research document: $RESEARCH_FILE"
 fi
 
@@ -8,6 +8,9 @@ set -euo pipefail
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 REPO_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"
 
+# Shared state helpers (atomic writes, artifact locks)
+source "$SCRIPT_DIR/common.sh"
+
 # Configuration
 CONFIG_FILE="$REPO_ROOT/.intent/enhanced-config.json"
 SCAN_PATTERNS=("**/*.md" "**/*.json" "**/*.yaml" "**/*.yml" "docs/**" "design/**" "specs/**")
@@ -183,7 +186,8 @@ generate_report() {
         --arg timestamp "$(date -u +"%Y-%m-%dT%H:%M:%SZ")" \
         '{timestamp: $timestamp, total_artifacts: ($count | tonumber), artifacts: $artifacts}')
 
-    echo "$report" > "$report_file"
+    # Replace the report atomically so concurrent readers never see a partial file
+    echo "$report" | with_file_lock "$report_file" write_file_atomic "$report_file"
 
     log_success "Scanned $artifact_count artifacts and saved report to $report_file"
 }
@@ -42,16 +42,24 @@ print_success "Specification found: $SPEC_FILE"
 mkdir -p "$FEATURE_DIR/contracts"
 mkdir -p "$FEATURE_DIR/plans"
 
-# Copy plan template if available
 PLAN_TEMPLATE="$REPO_ROOT/.intent/templates/plan-template.md"
 PLAN_FILE="$FEATURE_DIR/plans/plan.md"
+RESEARCH_FILE="$FEATURE_DIR/research.md"
+QUICKSTART_FILE="$FEATURE_DIR/quickstart.md"
+
+# Record artifact versions up front; writes below fail instead of clobbering
+# changes another agent makes to these files while this script runs
+PLAN_VERSION="$(artifact_version "$PLAN_FILE")"
+RESEARCH_VERSION="$(artifact_version "$RESEARCH_FILE")"
+QUICKSTART_VERSION="$(artifact_version "$QUICKSTART_FILE")"
 
+# Copy plan template if available
 if [ -f "$PLAN_TEMPLATE" ]; then
-    cp "$PLAN_TEMPLATE" "$PLAN_FILE"
+    write_file_if_version "$PLAN_FILE" "$PLAN_VERSION" < "$PLAN_TEMPLATE"
     print_success "Created plan template: $PLAN_FILE"
 else
     # Create basic plan structure
-    cat > "$PLAN_FILE" << EOF
+    write_file_if_version "$PLAN_FILE" "$PLAN_VERSION" << EOF
 # Implementation Plan: $INTENT_FEATURE
 
 **Created**: $(date -u +"%Y-%m-%dT%H:%M:%SZ")
@@ -96,8 +104,7 @@ EOF
 fi
 
 # Create research document
-RESEARCH_FILE="$FEATURE_DIR/research.md"
-cat > "$RESEARCH_FILE" << EOF
+write_file_if_version "$RESEARCH_FILE" "$RESEARCH_VERSION" << EOF
 # Research Document: $INTENT_FEATURE
 
 **Created**: $(date -u +"%Y-%m-%dT%H:%M:%SZ")
@@ -155,8 +162,7 @@ EOF
 print_success "Created research document: $RESEARCH_FILE"
 
 # Create quickstart document
-QUICKSTART_FILE="$FEATURE_DIR/quickstart.md"
-cat > "$QUICKSTART_FILE" << EOF
+write_file_if_version "$QUICKSTART_FILE" "$QUICKSTART_VERSION" << EOF
 # Quick Start: $INTENT_FEATURE
 
 **Created**: $(date -u +"%Y-%m-%dT%H:%M:%SZ")
@@ -20,7 +20,7 @@ if [ ! -f "$CONSTITUTION_FILE" ]; then
 
     mkdir -p "$REPO_ROOT/.intent/memory"
 
-    cat > "$CONSTITUTION_FILE" << 'EOF'
+    write_file_if_missing "$CONSTITUTION_FILE" << 'EOF'
 # Intent Kit Constitution
 
 ## Core Principles
@@ -109,7 +109,7 @@ if [ ! -d "$TEMPLATES_DIR" ]; then
     mkdir -p "$TEMPLATES_DIR/commands"
 
     # Create basic Intent template
-    cat > "$TEMPLATES_DIR/Intent-template.md" << 'EOF'
+    write_file_if_missing "$TEMPLATES_DIR/Intent-template.md" << 'EOF'
 # Feature Specification: [FEATURE NAME]
 
 **Feature Branch**: `[###-feature-name]`
@@ -155,7 +155,7 @@ if [ ! -d "$TEMPLATES_DIR" ]; then
 EOF
 
     # Create basic plan template
-    cat > "$TEMPLATES_DIR/plan-template.md" << 'EOF'
+    write_file_if_missing "$TEMPLATES_DIR/plan-template.md" << 'EOF'
 # Implementation Plan: [FEATURE NAME]
 
 **Created**: [DATE]
@@ -187,7 +187,7 @@ EOF
 EOF
 
     # Create basic tasks template
-    cat > "$TEMPLATES_DIR/tasks-template.md" << 'EOF'
+    write_file_if_missing "$TEMPLATES_DIR/tasks-template.md" << 'EOF'
 # Task Breakdown: [FEATURE NAME]
 
 **Created**: [DATE]
@@ -223,7 +223,7 @@ if [ ! -d "$COMMANDS_DIR" ]; then
     print_info "Creating command templates..."
 
     # Create Intended command template
-    cat > "$COMMANDS_DIR/Intended.md" << 'EOF'
+    write_file_if_missing "$COMMANDS_DIR/Intended.md" << 'EOF'
 ---
 description: Create or update the feature specification from a natural language feature description.
 scripts:
@@ -247,7 +247,7 @@ $ARGUMENTS
 EOF
 
     # Create plan command template
-    cat > "$COMMANDS_DIR/plan.md" << 'EOF'
+    write_file_if_missing "$COMMANDS_DIR/plan.md" << 'EOF'
 ---
 description: Create technical implementation plan for the current feature.
 scripts:
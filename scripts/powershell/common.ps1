@@ -296,9 +296,177 @@ function New-GitRepo {
     }
 }
 
+# Shared .intent/ state helpers
+#
+# Several agents or CI jobs may run these scripts against one checkout, so
+# artifacts are never written in place: content goes to a temporary file in
+# the same directory and is moved over the target. Read-modify-write steps
+# hold a per-artifact lock under .intent/.locks/ (the same lock files the
+# intent CLI and bash scripts use), and an artifact's version is the sha256 of
+# its content, so a writer can refuse to clobber changes it has not seen.
+
+# Function to get the lock file guarding an artifact
+function Get-IntentLockFile {
+    param([string]$Path)
+
+    $fullPath = [System.IO.Path]::GetFullPath($Path)
+    $parent = Split-Path $fullPath -Parent
+
+    # Same root rule as the intent CLI: nearest ancestor holding .intent/ or .git
+    $root = $null
+    $dir = $parent
+    while ($dir) {
+        if ((Test-Path -LiteralPath (Join-Path $dir '.intent') -PathType Container) -or (Test-Path -LiteralPath (Join-Path $dir '.git'))) {
+            $root = $dir
+            break
+        }
+        $dir = Split-Path $dir -Parent
+    }
+
+    if (-not $root) {
+        # Outside any project: lock beside the file rather than creating a stray .intent/
+        return Join-Path $parent ("." + (Split-Path $fullPath -Leaf) + ".lock")
+    }
+    $relative = [System.IO.Path]::GetRelativePath($root, $fullPath) -replace '\\', '/'
+    $name = ($relative -replace '[^A-Za-z0-9._-]', '_') + ".lock"
+    return Join-Path $root ".intent" ".locks" $name
+}
+
+# Function to run a script block while holding an artifact's lock
+function Invoke-WithFileLock {
+    param(
+        [string]$Path,
+        [scriptblock]$ScriptBlock
+    )
+
+    $lockFile = Get-IntentLockFile $Path
+    New-Item -ItemType Directory -Force -Path (Split-Path $lockFile -Parent) | Out-Null
+
+    $timeout = if ($env:INTENT_LOCK_TIMEOUT) { [int]$env:INTENT_LOCK_TIMEOUT } else { 30 }
+    $deadline = (Get-Date).AddSeconds($timeout)
+    while ($true) {
+        try {
+            # FileShare.None is an exclusive lock (flock on Unix, share mode on Windows)
+            $handle = [System.IO.File]::Open($lockFile, 'OpenOrCreate', 'ReadWrite', 'None')
+            break
+        }
+        catch [System.IO.IOException] {
+            if ((Get-Date) -gt $deadline) {
+                Write-Error "Timed out waiting for lock on $Path"
+                exit 1
+            }
+            Start-Sleep -Milliseconds 100
+        }
+    }
+
+    try {
+        & $ScriptBlock
+    }
+    finally {
+        $handle.Dispose()
+    }
+}
+
+# Function to write content to a file atomically (temp file + move)
+function Write-FileAtomic {
+    param(
+        [string]$Path,
+        [string]$Value
+    )
+
+    $fullPath = [System.IO.Path]::GetFullPath($Path)
+    $tmp = Join-Path (Split-Path $fullPath -Parent) (".{0}.{1}.tmp" -f (Split-Path $fullPath -Leaf), [guid]::NewGuid().ToString('N').Substring(0, 8))
+    try {
+        Set-Content -Path $tmp -Value $Value
+        [System.IO.File]::Move($tmp, $fullPath, $true)
+    }
+    finally {
+        if (Test-Path $tmp) {
+            Remove-Item $tmp -Force
+        }
+    }
+}
+
+# Function to copy a file atomically
+function Copy-FileAtomic {
+    param(
+        [string]$Source,
+        [string]$Destination
+    )
+
+    $fullPath = [System.IO.Path]::GetFullPath($Destination)
+    $tmp = Join-Path (Split-Path $fullPath -Parent) (".{0}.{1}.tmp" -f (Split-Path $fullPath -Leaf), [guid]::NewGuid().ToString('N').Substring(0, 8))
+    try {
+        Copy-Item $Source $tmp
+        [System.IO.File]::Move($tmp, $fullPath, $true)
+    }
+    finally {
+        if (Test-Path $tmp) {
+            Remove-Item $tmp -Force
+        }
+    }
+}
+
+# Function to create an empty file unless it already exists (atomic replacement for New-Item -Force)
+function New-FileIfMissing {
+    param([string]$Path)
+
+    try {
+        [System.IO.File]::Open([System.IO.Path]::GetFullPath($Path), 'CreateNew').Dispose()
+    }
+    catch [System.IO.IOException] {
+        # Already exists
+    }
+}
+
+# Function to get an artifact's version (sha256 of its content, or "none" if missing)
+function Get-ArtifactVersion {
+    param([string]$Path)
+
+    if (-not (Test-Path $Path -PathType Leaf)) {
+        return "none"
+    }
+    return (Get-FileHash -Path $Path -Algorithm SHA256).Hash.ToLower()
+}
+
+# Function to write a file only if it is still at the expected version
+# Pass "none" to create a file only if it does not exist yet. Exits with 3 on conflict.
+function Write-FileIfVersion {
+    param(
+        [string]$Path,
+        [string]$Value,
+        [string]$ExpectedVersion
+    )
+
+    Invoke-WithFileLock $Path {
+        $current = Get-ArtifactVersion $Path
+        if ($current -ne $ExpectedVersion) {
+            Write-Error "$Path was changed by another process (expected version $ExpectedVersion, found $current)"
+            exit 3
+        }
+        Write-FileAtomic -Path $Path -Value $Value
+    }
+}
+
+# Function to write a file only if it does not exist yet (no-op otherwise)
+function Write-FileIfMissing {
+    param(
+        [string]$Path,
+        [string]$Value
+    )
+
+    Invoke-WithFileLock $Path {
+        if (-not (Test-Path $Path)) {
+            Write-FileAtomic -Path $Path -Value $Value
+        }
+    }
+}
+
 # Export functions so they can be used by other scripts
 Export-ModuleMember -Function Write-Info, Write-Success, Write-Warning, Write-Error
 Export-ModuleMember -Function Test-Command, Get-RepoRoot, Test-GitRepo
 Export-ModuleMember -Function Get-NextFeatureNumber, Format-FeatureNumber, New-BranchName
 Export-ModuleMember -Function Test-BranchNameLength, Invoke-Command, Confirm-Action
-Export-ModuleMember -Function Test-Directory, New-GitRepo
\ No newline at end of file
+Export-ModuleMember -Function Test-Directory, New-GitRepo
+Export-ModuleMember -Function Get-IntentLockFile, Invoke-WithFileLock, Write-FileAtomic, Copy-FileAtomic
+Export-ModuleMember -Function New-FileIfMissing, Get-ArtifactVersion, Write-FileIfVersion, Write-FileIfMissing
\ No newline at end of file
@@ -48,24 +48,26 @@ else {
     $branchSuffix = New-BranchName $featureDescription
 }
 
-# Determine branch number
-if ($Number -eq 0) {
-    if (Test-GitRepo) {
+# Allocate the feature number and claim its directory while holding the
+# intents/ lock, so parallel runs never pick the same number
+$branchName = Invoke-WithFileLock $intentsDir {
+    if ($Number -eq 0) {
         $branchNumber = Get-NextFeatureNumber $intentsDir
     }
     else {
-        $branchNumber = Get-NextFeatureNumber $intentsDir
+        $branchNumber = $Number
     }
-}
-else {
-    $branchNumber = $Number
-}
 
-$featureNum = Format-FeatureNumber $branchNumber
-$branchName = "$featureNum-$branchSuffix"
+    $featureNum = Format-FeatureNumber $branchNumber
+    $name = "$featureNum-$branchSuffix"
+
+    # Validate branch name length
+    $name = Test-BranchNameLength $name
 
-# Validate branch name length
-$branchName = Test-BranchNameLength $branchName
+    New-Item -ItemType Directory -Force -Path (Join-Path $intentsDir $name) | Out-Null
+    $name
+}
+$featureNum = $branchName.Split('-')[0]
 
 # Create and checkout branch if in git repo
 if (Test-GitRepo) {
@@ -84,11 +86,11 @@ $template = Join-Path $repoRoot ".intent\templates\Intent-template.md"
 $specFile = Join-Path $featureDir "Intent.md"
 
 if (Test-Path $template) {
-    Copy-Item $template $specFile
+    Copy-FileAtomic $template $specFile
     Write-Success "Created specification template: $specFile"
 }
 else {
-    New-Item -ItemType File -Path $specFile | Out-Null
+    New-FileIfMissing $specFile
     Write-Warning "Template not found, created empty Intent file: $specFile"
 }
 
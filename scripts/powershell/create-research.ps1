@@ -73,7 +73,7 @@ $intentFile = Join-Path $featureDir "Intent.md"
 if (-not (Test-Path $intentFile)) {
     Write-Warning "Intent.md not found in $featureDir"
     Write-Info "Creating placeholder Intent.md..."
-    New-Item -ItemType File -Path $intentFile -Force | Out-Null
+    New-FileIfMissing $intentFile
 }
 
 # Create research directory
@@ -92,11 +92,11 @@ if (-not (Test-Path $template)) {
 }
 
 if (Test-Path $template) {
-    Copy-Item $template $researchFile
+    Copy-FileAtomic $template $researchFile
     Write-Success "Created research document from template: $researchFile"
 }
 else {
-    New-Item -ItemType File -Path $researchFile -Force | Out-Null
+    New-FileIfMissing $researchFile
     Write-Warning "Research template not found, created empty research document: $researchFile"
 }
 
@@ -12,6 +12,9 @@ param(
     [switch]$Verbose
 )
 
+# Shared state helpers (atomic writes, artifact locks)
+. (Join-Path $PSScriptRoot "common.ps1")
+
 # Configuration
 $ScanPatterns = @("**/*.md", "**/*.json", "**/*.yaml", "**/*.yml", "docs/**", "design/**", "specs/**")
 $IgnorePatterns = @("node_modules/**", ".git/**", "dist/**", "build/**", "**/.DS_Store")
@@ -169,8 +172,11 @@ function New-ArtifactReport {
         }
     }
 
-    # Save as JSON
-    $report | ConvertTo-Json -Depth 10 | Out-File $reportFile -Encoding UTF8
+    # Save as JSON, replacing the report atomically so concurrent readers never see a partial file
+    $reportJson = $report | ConvertTo-Json -Depth 10
+    Invoke-WithFileLock $reportFile {
+        Write-FileAtomic -Path $reportFile -Value $reportJson
+    }
 
     Write-Log "Scanned $($Artifacts.Count) artifacts and saved report to $reportFile" -Level Success
 }
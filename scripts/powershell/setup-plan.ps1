@@ -40,12 +40,20 @@ $contractsDir = Join-Path $featureDir "contracts"
 $plansDir = Join-Path $featureDir "plans"
 New-Item -ItemType Directory -Force -Path $contractsDir, $plansDir | Out-Null
 
-# Create plan file
 $planTemplate = Join-Path $repoRoot ".intent\templates\plan-template.md"
 $planFile = Join-Path $plansDir "plan.md"
+$researchFile = Join-Path $featureDir "research.md"
+$quickstartFile = Join-Path $featureDir "quickstart.md"
+
+# Record artifact versions up front; writes below fail instead of clobbering
+# changes another agent makes to these files while this script runs
+$planVersion = Get-ArtifactVersion $planFile
+$researchVersion = Get-ArtifactVersion $researchFile
+$quickstartVersion = Get-ArtifactVersion $quickstartFile
 
+# Create plan file
 if (Test-Path $planTemplate) {
-    Copy-Item $planTemplate $planFile
+    Write-FileIfVersion -Path $planFile -Value (Get-Content -Path $planTemplate -Raw) -ExpectedVersion $planVersion
     Write-Success "Created plan template: $planFile"
 }
 else {
@@ -80,12 +88,11 @@ else {
 ## Risk Assessment
 [Identify potential risks and mitigation strategies]
 "@
-    Set-Content -Path $planFile -Value $planContent
+    Write-FileIfVersion -Path $planFile -Value $planContent -ExpectedVersion $planVersion
     Write-Success "Created basic plan structure: $planFile"
 }
 
 # Create research document
-$researchFile = Join-Path $featureDir "research.md"
 $date = Get-Date -Format "yyyy-MM-ddTHH:mm:ssZ"
 $researchContent = @"
 # Research Document: $env:INTENT_FEATURE
@@ -124,11 +131,10 @@ $researchContent = @"
 ### Open Questions
 [Unresolved questions that need answers]
 "@
-Set-Content -Path $researchFile -Value $researchContent
+Write-FileIfVersion -Path $researchFile -Value $researchContent -ExpectedVersion $researchVersion
 Write-Success "Created research document: $researchFile"
 
 # Create quickstart document
-$quickstartFile = Join-Path $featureDir "quickstart.md"
 $quickstartContent = @"
 # Quick Start: $env:INTENT_FEATURE
 
@@ -158,7 +164,7 @@ $quickstartContent = @"
 ## Next Steps
 [What to do after this feature is complete]
 "@
-Set-Content -Path $quickstartFile -Value $quickstartContent
+Write-FileIfVersion -Path $quickstartFile -Value $quickstartContent -ExpectedVersion $quickstartVersion
 Write-Success "Created quickstart document: $quickstartFile"
 
 Write-Success "Plan setup complete!"
@@ -55,7 +55,7 @@ All decisions, assumptions, and trade-offs are documented. Specifications are wr
 **Version**: 1.0.0 | **Established**: 2025-01-01 | **Last Amended**: Never
 '@
 
-    Set-Content -Path $constitutionFile -Value $constitutionContent
+    Write-FileIfMissing -Path $constitutionFile -Value $constitutionContent
     Write-Success "Created default constitution: $constitutionFile"
 }
 
@@ -110,7 +110,7 @@ if (-not (Test-Path $templatesDir)) {
 - **SC-001**: [Measurable metric, e.g., "Users can complete task in under 2 minutes"]
 - **SC-002**: [Measurable metric, e.g., "System handles 1000 concurrent users"]
 '@
-    Set-Content -Path $specTemplate -Value $specContent
+    Write-FileIfMissing -Path $specTemplate -Value $specContent
 
     # Create basic plan template
     $planTemplate = Join-Path $templatesDir "plan-template.md"
@@ -140,7 +140,7 @@ if (-not (Test-Path $templatesDir)) {
 ## Risk Assessment
 [Identify potential risks and mitigation strategies]
 '@
-    Set-Content -Path $planTemplate -Value $planContent
+    Write-FileIfMissing -Path $planTemplate -Value $planContent
 
     # Create basic tasks template
     $tasksTemplate = Join-Path $templatesDir "tasks-template.md"
@@ -165,7 +165,7 @@ if (-not (Test-Path $templatesDir)) {
 ## Dependencies
 [Note any dependencies between tasks]
 '@
-    Set-Content -Path $tasksTemplate -Value $tasksContent
+    Write-FileIfMissing -Path $tasksTemplate -Value $tasksContent
 
     Write-Success "Created basic templates in: $templatesDir"
 }
@@ -200,7 +200,7 @@ $ARGUMENTS
 4. Set up basic template structure
 5. Return branch name and file paths
 '@
-    Set-Content -Path $specifyTemplate -Value $specifyContent
+    Write-FileIfMissing -Path $specifyTemplate -Value $specifyContent
 
     # Create plan command template
     $planTemplate = Join-Path $commandsDir "plan.md"
@@ -220,7 +220,7 @@ scripts:
 4. Create research and quickstart documents
 5. Set up for task breakdown
 '@
-    Set-Content -Path $planTemplate -Value $planContent
+    Write-FileIfMissing -Path $planTemplate -Value $planContent
 
     Write-Success "Created command templates in: $commandsDir"
 }
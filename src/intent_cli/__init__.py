@@ -15,9 +15,14 @@ Or install globally:
     intent init <project-name>
     intent init .
     intent init --here
+
+Keep derived project state warm for editors and hooks:
+    intent watch
+    intent query validation
 """
 
 import os
+import errno
 import subprocess
 import sys
 import zipfile
@@ -25,6 +30,20 @@ import tempfile
 import shutil
 import shlex
 import json
+import hashlib
+import zlib
+import re
+import fnmatch
+import select
+import signal
+import socket
+import socketserver
+import struct
+import threading
+import time
+import ctypes
+import ctypes.util
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
@@ -179,6 +198,11 @@ AGENT_CONFIG = {
 
 SCRIPT_TYPE_CHOICES = {"sh": "POSIX Shell (bash/zsh)", "ps": "PowerShell"}
 
+INTENT_DIR_NAME = ".intent"
+ENHANCED_CONFIG_NAME = "enhanced-config.json"
+TASKS_FILE_NAME = "tasks.md"
+WATCH_SOCKET_NAME = "watch.sock"
+
 BANNER = """
 ╔══════════════════════════════════════════════════════════════════╗
 ║                                                                  ║
@@ -511,12 +535,423 @@ def callback(ctx: typer.Context):
         console.print(quick_actions_panel)
 
 
+# Concurrency-safe .intent/ state
+#
+# Artifacts are never written in place: content goes to a temporary file in
+# the same directory and is renamed over the target. Read-modify-write steps
+# hold a per-artifact advisory lock under .intent/.locks/ (shared with the
+# bash and PowerShell scripts), and an artifact's version is the sha256 of its
+# content, so writers can refuse to clobber changes they have not seen.
+STATE_LOCK_DIR_NAME = ".locks"
+ARTIFACT_MISSING = "none"  # version token of an artifact that does not exist
+
+
+class ArtifactConflictError(Exception):
+    """Raised when an artifact changed since the version a writer expected."""
+
+    def __init__(self, path: Path, expected: str, current: str):
+        super().__init__(f"{path} was changed by another process (expected version {expected}, found {current})")
+        self.path = path
+        self.expected = expected
+        self.current = current
+
+
+@contextmanager
+def _file_lock(lock_path: Path, shared: bool = False):
+    """Hold an advisory lock on lock_path (flock on POSIX, msvcrt byte lock on Windows)."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        try:
+            handle = open(lock_path, "a+b")
+            break
+        except PermissionError:
+            # Invoke-WithFileLock in common.ps1 holds the lock by opening the file with
+            # FileShare.None, which makes this open fail on Windows until it is released
+            if os.name != "nt":
+                raise
+            time.sleep(0.1)
+    with handle:
+        if os.name == "nt":
+            import msvcrt
+            handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10s; keep waiting like flock does
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _find_project_root(path: Path) -> Optional[Path]:
+    """Return the nearest ancestor of path holding .intent/ or .git, or None outside any project."""
+    for candidate in path.parents:
+        if (candidate / INTENT_DIR_NAME).is_dir() or (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def artifact_lock_path(path: Path, project_path: Optional[Path] = None) -> Path:
+    """Return the lock file guarding an artifact.
+
+    Uses the same root rule and naming as intent_lock_file in common.sh and
+    Get-IntentLockFile in common.ps1. Files outside any project are locked
+    with a sibling `.<name>.lock` instead of creating a stray .intent/.
+    """
+    path = Path(path).resolve()
+    root = project_path.resolve() if project_path else _find_project_root(path)
+    if root is None:
+        return path.parent / f".{path.name}.lock"
+    try:
+        rel_path = path.relative_to(root).as_posix()
+    except ValueError:
+        rel_path = path.as_posix()
+    name = re.sub(rb"[^A-Za-z0-9._-]", b"_", rel_path.encode("utf-8")).decode("ascii")
+    return root / INTENT_DIR_NAME / STATE_LOCK_DIR_NAME / f"{name}.lock"
+
+
+@contextmanager
+def _atomic_output(path: Path, mode: Optional[int] = None):
+    """Yield a binary handle whose content replaces path in a single rename on success."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            yield handle
+            handle.flush()
+            os.fsync(handle.fileno())
+        if mode is None:
+            try:
+                mode = path.stat().st_mode & 0o777
+            except OSError:
+                mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write(path: Path, data: Union[bytes, str], mode: Optional[int] = None):
+    """Replace path with data so readers see either the old or the new content, never a mix."""
+    with _atomic_output(path, mode) as handle:
+        handle.write(data.encode("utf-8") if isinstance(data, str) else data)
+
+
+def atomic_copy(src: Path, dest: Path):
+    """Copy src over dest atomically, keeping src's permission bits like shutil.copy."""
+    with open(src, "rb") as source, _atomic_output(dest, src.stat().st_mode & 0o777) as handle:
+        shutil.copyfileobj(source, handle, 1024 * 1024)
+
+
+def artifact_version(path: Path) -> str:
+    """Return an artifact's version token: the sha256 of its content, or "none" if missing."""
+    try:
+        return _sha256_file(path)
+    except FileNotFoundError:
+        return ARTIFACT_MISSING
+
+
+def write_artifact(path: Path, data: Union[bytes, str], expected_version: Optional[str] = None, project_path: Optional[Path] = None) -> str:
+    """Atomically replace an artifact under its lock and return the new version.
+
+    With expected_version, the write only happens if the artifact is still at
+    that version ("none" means it must not exist yet); otherwise
+    ArtifactConflictError is raised and the file is left untouched.
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with _file_lock(artifact_lock_path(path, project_path)):
+        if expected_version is not None:
+            current = artifact_version(path)
+            if current != expected_version:
+                raise ArtifactConflictError(path, expected_version, current)
+        atomic_write(path, data)
+        # Hash what was written, not the file: another writer may replace it once the lock drops
+        return hashlib.sha256(data).hexdigest()
+
+
+def create_if_missing(path: Path, data: Union[bytes, str] = b"", project_path: Optional[Path] = None) -> bool:
+    """Create an artifact only if it does not exist yet; return whether it was created."""
+    if not data:
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            return True
+        except FileExistsError:
+            return False
+    try:
+        write_artifact(path, data, ARTIFACT_MISSING, project_path)
+        return True
+    except ArtifactConflictError:
+        return False
+
+
+# Offline template packs (release archives built by create-release-packages.sh)
+PACK_ARCHIVE_RE = re.compile(r"^intended-template-(?P<agent>.+)-(?P<script>sh|ps)-v(?P<version>\d+\.\d+\.\d+)\.zip$")
+PACK_CHECKSUMS_NAME = "SHA256SUMS"
+# Top-level files some release packages ship next to the agent folder
+AGENT_PACK_EXTRAS = {
+    "gemini": ["GEMINI.md"],
+    "qwen": ["QWEN.md"],
+    "copilot": [".vscode/settings.json"],
+}
+# Pack members that belong to the user once they exist in the project
+PACK_PRESERVED_MEMBERS = {".intent/memory/constitution.md"}
+
+
+def _pack_cache_dir() -> Path:
+    """Return the shared pack cache (INTENT_PACK_CACHE or the user cache directory)."""
+    override = os.getenv("INTENT_PACK_CACHE")
+    if override:
+        return Path(override).expanduser()
+    import platformdirs
+    return Path(platformdirs.user_cache_dir("intent-cli")) / "packs"
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_checksums(directory: Path) -> dict[str, str]:
+    """Parse a `sha256sum`-style SHA256SUMS file into {filename: hex digest}."""
+    checksums = {}
+    try:
+        lines = (directory / PACK_CHECKSUMS_NAME).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return checksums
+    for line in lines:
+        parts = line.strip().split(maxsplit=1)
+        if len(parts) == 2:
+            checksums[parts[1].lstrip("*")] = parts[0].lower()
+    return checksums
+
+
+def _expected_pack_digest(archive: Path) -> Optional[str]:
+    """Look up the published digest for an archive from SHA256SUMS or a `<archive>.sha256` sidecar."""
+    digest = _read_checksums(archive.parent).get(archive.name)
+    if digest:
+        return digest
+    try:
+        return (archive.parent / f"{archive.name}.sha256").read_text(encoding="utf-8").split()[0].lower()
+    except (OSError, IndexError):
+        return None
+
+
+def _cli_version() -> Optional[tuple[int, ...]]:
+    """Return the installed intent-cli version, or None when running from a source tree."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return tuple(int(n) for n in re.findall(r"\d+", version("intent-cli"))[:3])
+    except PackageNotFoundError:
+        return None
+
+
+def _find_pack_archive(directory: Path, agent: str, script: str, min_version: Optional[tuple[int, ...]] = None) -> Optional[Path]:
+    """Return the newest release archive for agent/script in a directory, if any (and at least min_version)."""
+    best, best_version = None, None
+    for candidate in directory.glob("intended-template-*.zip"):
+        match = PACK_ARCHIVE_RE.match(candidate.name)
+        if not match or match.group("agent") != agent or match.group("script") != script:
+            continue
+        version = tuple(int(n) for n in match.group("version").split("."))
+        if min_version is not None and version < min_version:
+            continue
+        if best_version is None or version > best_version:
+            best, best_version = candidate, version
+    return best
+
+
+def _unsafe_pack_member(name: str) -> bool:
+    """Return True for member names that would land outside the project when extracted."""
+    name = name.removeprefix("./").replace("\\", "/")
+    return name.startswith("/") or re.match(r"^[A-Za-z]:", name) is not None or ".." in name.split("/")
+
+
+def _verify_pack_archive(archive: Path):
+    """Reject archives with unsafe member paths or corrupt members before anything is extracted or cached."""
+    with zipfile.ZipFile(archive) as zf:
+        for name in zf.namelist():
+            if _unsafe_pack_member(name):
+                raise ValueError(f"Unsafe path in template pack {archive.name}: {name}")
+        try:
+            bad = zf.testzip()
+        except (EOFError, NotImplementedError, zlib.error) as e:
+            raise zipfile.BadZipFile(f"Template pack {archive.name} is corrupt: {e}") from e
+    if bad is not None:
+        raise zipfile.BadZipFile(f"Corrupt member in template pack {archive.name}: {bad}")
+
+
+def _import_pack(archive: Path, digest: str, cache_dir: Path) -> Path:
+    """Copy a verified archive into the shared cache and record its digest.
+
+    Cache entries are written to a temporary name and renamed into place
+    under an exclusive lock, so concurrent inits never see a partial archive
+    and can read cached packs without locking.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with _file_lock(cache_dir / ".lock"):
+        checksums = _read_checksums(cache_dir)
+        cached = cache_dir / archive.name
+        if checksums.get(archive.name) == digest and cached.exists():
+            return cached
+        if archive.name in checksums:
+            return archive  # a different build already owns this name; leave the cache alone
+        atomic_copy(archive, cached)
+        checksums[archive.name] = digest
+        atomic_write(cache_dir / PACK_CHECKSUMS_NAME, "".join(f"{d}  {n}\n" for n, d in sorted(checksums.items())))
+    return cached
+
+
+def resolve_template_pack(pack: Optional[str], agent: str, script: str, expected_sha256: Optional[str] = None, allow_unverified: bool = False) -> Optional[Path]:
+    """Locate and verify the template pack for agent/script.
+
+    `pack` may be a release archive, a directory of release archives, or an
+    extracted release tree (a directory containing `.intent/`). Without
+    `pack`, the shared cache is searched only when INTENT_PACK_CACHE is set,
+    skipping packs older than the installed CLI. Returns None when no pack
+    applies, in which case init falls back to the bundled templates. Archives without
+    a published checksum are refused unless `allow_unverified` is set, and
+    are then used in place without entering the cache.
+    """
+    cache_dir = _pack_cache_dir()
+    if pack is None:
+        if not os.getenv("INTENT_PACK_CACHE") or not cache_dir.is_dir():
+            return None
+        source = _find_pack_archive(cache_dir, agent, script, _cli_version())
+        if source is None:
+            return None
+    else:
+        source = Path(pack).expanduser().resolve()
+        if source.is_dir():
+            if (source / INTENT_DIR_NAME).is_dir():
+                return source
+            found = _find_pack_archive(source, agent, script)
+            if found is None:
+                raise FileNotFoundError(f"No intended-template-{agent}-{script}-v*.zip in {source}")
+            source = found
+        elif not source.is_file():
+            raise FileNotFoundError(f"Template pack not found: {source}")
+
+    if not zipfile.is_zipfile(source):
+        raise ValueError(f"Template pack is not a zip archive: {source}")
+    digest = _sha256_file(source)
+    expected = (expected_sha256 or _expected_pack_digest(source) or "").lower()
+    if expected and expected != digest:
+        raise ValueError(f"Checksum mismatch for {source.name}: expected {expected}, got {digest}")
+    _verify_pack_archive(source)
+    if not expected:
+        if not allow_unverified:
+            raise ValueError(f"No published checksum for {source.name}; pass --pack-sha256 or --allow-unverified-pack")
+        console.print(f"[yellow]⚠️  Using unverified pack {source.name} (sha256 {digest}); it will not be cached[/yellow]")
+        return source
+    if source.parent != cache_dir:
+        try:
+            source = _import_pack(source, digest, cache_dir)
+        except OSError as e:
+            console.print(f"[yellow]⚠️  Could not add {source.name} to the pack cache ({e})[/yellow]")
+    return source
+
+
+def _pack_member_needed(name: str, agent: str, script: str) -> bool:
+    """Return True for pack members the chosen agent and script type need."""
+    other_scripts = "powershell" if script == "sh" else "bash"
+    if name.startswith(f"{INTENT_DIR_NAME}/"):
+        return not name.startswith(f"{INTENT_DIR_NAME}/scripts/{other_scripts}/")
+    return name.startswith(AGENT_CONFIG[agent]["folder"]) or name in AGENT_PACK_EXTRAS.get(agent, [])
+
+
+def _pack_member_unchanged(dest: Path, size: int, crc: int) -> bool:
+    """Cheaply check an already-extracted file against the archive's size and CRC-32."""
+    try:
+        if dest.stat().st_size != size:
+            return False
+        value = 0
+        with open(dest, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                value = zlib.crc32(chunk, value)
+        return value == crc
+    except OSError:
+        return False
+
+
+def install_template_pack(pack: Path, project_path: Path, agent: str, script: str) -> tuple[int, int]:
+    """Extract the members needed for agent/script from a pack into project_path.
+
+    Members stream straight from the archive into an atomic rename; files that already
+    match (by size and CRC-32) are left untouched, so an interrupted install
+    resumes where it stopped. Returns (written, unchanged) counts.
+    """
+    written = unchanged = 0
+
+    def target_for(name: str) -> Optional[Path]:
+        name = name.removeprefix("./")
+        if not name or name.endswith("/") or not _pack_member_needed(name, agent, script):
+            return None
+        if _unsafe_pack_member(name):
+            raise ValueError(f"Unsafe path in template pack: {name}")
+        dest = project_path / name
+        if name in PACK_PRESERVED_MEMBERS and dest.exists():
+            return None
+        return dest
+
+    if pack.is_dir():
+        for directory, filenames in _walk_workspace(pack, []):
+            for filename in filenames:
+                src = directory / filename
+                dest = target_for(src.relative_to(pack).as_posix())
+                if dest is None:
+                    continue
+                if dest.exists() and dest.stat().st_size == src.stat().st_size and dest.read_bytes() == src.read_bytes():
+                    unchanged += 1
+                    continue
+                atomic_copy(src, dest)
+                written += 1
+        return written, unchanged
+
+    with zipfile.ZipFile(pack) as archive:
+        for info in archive.infolist():
+            dest = target_for(info.filename)
+            if dest is None:
+                continue
+            if _pack_member_unchanged(dest, info.file_size, info.CRC):
+                unchanged += 1
+                continue
+            mode = (info.external_attr >> 16) & 0o777 or None
+            with archive.open(info) as src, _atomic_output(dest, mode) as out:
+                shutil.copyfileobj(src, out, 1024 * 1024)
+            written += 1
+    return written, unchanged
+
+
 @app.command()
 def init(
     project_name: str = typer.Argument(None, help="Name of the project to initialize"),
     ai_assistant: str = typer.Option(None, "--ai", help="AI assistant to use: " + ", ".join(AGENT_CONFIG.keys())),
     enhanced: list[str] = typer.Option([], "--enhanced", help="Enhanced features to enable"),
     all_enhanced: bool = typer.Option(False, "--all-enhanced", help="Enable all enhanced features"),
+    script_type: str = typer.Option(None, "--script", help="Script type to use: sh or ps"),
+    pack: str = typer.Option(None, "--pack", help="Offline template pack: release zip, directory of release zips, or extracted release tree (defaults to the shared pack cache)"),
+    pack_sha256: str = typer.Option(None, "--pack-sha256", help="Expected SHA-256 of the pack archive (otherwise read from SHA256SUMS or <archive>.sha256)"),
+    allow_unverified_pack: bool = typer.Option(False, "--allow-unverified-pack", help="Use a pack archive that has no published checksum (it is not added to the pack cache)"),
 ):
     """Initialize a new Intent-Driven Development project with AI agent integration."""
     if project_name is None:
@@ -552,6 +987,18 @@ def init(
     
     ai_assistant = selected_assistant
 
+    if script_type is None:
+        script_type = "ps" if os.name == "nt" else "sh"
+    elif script_type not in SCRIPT_TYPE_CHOICES:
+        console.print(f"[red]❌ Invalid script type: {script_type}. Choose from: {', '.join(SCRIPT_TYPE_CHOICES)}[/red]")
+        raise typer.Exit(1)
+
+    try:
+        template_pack = resolve_template_pack(pack, ai_assistant, script_type, pack_sha256, allow_unverified_pack)
+    except (OSError, ValueError, zipfile.BadZipFile) as e:
+        console.print(f"[red]❌ Template pack unusable: {e}[/red]")
+        raise typer.Exit(1)
+
     # Determine enhanced features
     if all_enhanced:
         enabled_features = list(ENHANCED_FEATURES.keys())
@@ -564,6 +1011,8 @@ def init(
     console.print(f"Initializing project: {project_name}")
     console.print(f"AI Assistant: {ai_assistant}")
     console.print(f"Enhanced features: {enabled_features}")
+    if template_pack is not None:
+        console.print(f"Template pack: {template_pack}")
 
     # Implement project creation
     import shutil
@@ -580,8 +1029,6 @@ def init(
     agent_config = AGENT_CONFIG[ai_assistant]
     agent_dir = project_path / agent_config["folder"]
     agent_dir.mkdir(parents=True, exist_ok=True)
-    commands_dir = agent_dir / "commands"
-    commands_dir.mkdir(exist_ok=True)
     tracker.complete("Agent directory", f"Created {agent_dir}")
     
     # Create .intent directory for intent-specific configurations
@@ -589,27 +1036,40 @@ def init(
     intent_dir.mkdir(parents=True, exist_ok=True)
     tracker.complete("Intent directory", f"Created {intent_dir}")
 
-    # Determine format
-    if ai_assistant in ["gemini", "qwen"]:
-        format_ext = "toml"
-    else:
-        format_ext = "md"
-
-    # Copy command templates
-    templates_dir = Path(__file__).parent.parent.parent / "templates" / "commands"
-    if templates_dir.exists():
-        copied = 0
-        for template_file in templates_dir.glob(f"*.{format_ext}"):
-            shutil.copy(template_file, commands_dir / template_file.name)
-            copied += 1
-        tracker.complete("Command templates", f"Copied {copied} templates")
+    templates_src = Path(__file__).parent.parent.parent / "templates"
+    if template_pack is not None:
+        try:
+            written, unchanged = install_template_pack(template_pack, project_path, ai_assistant, script_type)
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            console.print(f"[red]❌ Template pack install failed: {e}[/red]")
+            raise typer.Exit(1)
+        tracker.complete("Template pack", f"Extracted {written} files ({unchanged} already up to date) from {template_pack.name}")
+        # The pack ships supporting templates under .intent/templates/
+        templates_src = intent_dir / "templates"
     else:
-        tracker.error("Command templates", "Templates directory not found")
+        # Determine format
+        if ai_assistant in ["gemini", "qwen"]:
+            format_ext = "toml"
+        else:
+            format_ext = "md"
+
+        # Copy command templates
+        commands_dir = agent_dir / "commands"
+        commands_dir.mkdir(exist_ok=True)
+        templates_dir = templates_src / "commands"
+        if templates_dir.exists():
+            copied = 0
+            for template_file in templates_dir.glob(f"*.{format_ext}"):
+                atomic_copy(template_file, commands_dir / template_file.name)
+                copied += 1
+            tracker.complete("Command templates", f"Copied {copied} templates")
+        else:
+            tracker.error("Command templates", "Templates directory not found")
 
     # Create core artifacts inside .intent directory
     artifacts = ["Intent.md", "plan.md", "tasks.md"]
     for artifact in artifacts:
-        (intent_dir / artifact).touch()
+        create_if_missing(intent_dir / artifact)
     tracker.complete("Core artifacts", f"Created {', '.join(artifacts)}")
 
     # Create additional directories inside .intent directory
@@ -620,69 +1080,67 @@ def init(
 
     # Create constitution if memory exists
     constitution_path = intent_dir / "memory" / "constitution.md"
-    if not constitution_path.exists():
-        constitution_path.write_text("# Project Constitution\n\nDefine your project principles here.\n")
+    if create_if_missing(constitution_path, "# Project Constitution\n\nDefine your project principles here.\n", project_path):
         tracker.complete("Constitution", "Created default constitution.md")
 
-    # Copy supporting templates to .intent/templates/
-    templates_src = Path(__file__).parent.parent.parent / "templates"
-    intent_templates_dir = intent_dir / "templates"
-    intent_templates_dir.mkdir(exist_ok=True)
-    template_files = [
-        "intent-template.md",
-        "plan-template.md",
-        "tasks-template.md",
-        "research-template.md",
-        "checklist-template.md",
-    ]
-    template_copied = 0
-    for tf in template_files:
-        src = templates_src / tf
-        if src.exists():
-            shutil.copy(src, intent_templates_dir / tf)
-            template_copied += 1
-    if template_copied > 0:
-        tracker.complete("Supporting templates", f"Copied {template_copied} templates to .intent/templates/")
-
-    # Copy scripts to .intent/scripts/
-    scripts_src_dir = Path(__file__).parent.parent.parent / "scripts"
-    intent_scripts_dir = intent_dir / "scripts"
-    intent_scripts_dir.mkdir(exist_ok=True)
-
-    # Try bash scripts first (default), fall back to powershell
-    script_src_dir = scripts_src_dir / "bash"
-    if not script_src_dir.exists():
-        script_src_dir = scripts_src_dir / "powershell"
-    script_copied = 0
-    if script_src_dir.exists():
-        for script_file in script_src_dir.glob("*"):
-            if script_file.is_file():
-                shutil.copy(script_file, intent_scripts_dir / script_file.name)
-                script_copied += 1
-        # Make scripts executable on Unix-like systems
-        if os.name != "nt":
-            for f in intent_scripts_dir.iterdir():
-                if f.suffix in (".sh", ".ps1"):
-                    f.chmod(f.stat().st_mode | 0o111)
-    if script_copied > 0:
-        tracker.complete("Setup scripts", f"Copied {script_copied} scripts to .intent/scripts/")
+    if template_pack is None:
+        # Copy supporting templates to .intent/templates/
+        intent_templates_dir = intent_dir / "templates"
+        intent_templates_dir.mkdir(exist_ok=True)
+        template_files = [
+            "intent-template.md",
+            "plan-template.md",
+            "tasks-template.md",
+            "research-template.md",
+            "checklist-template.md",
+        ]
+        template_copied = 0
+        for tf in template_files:
+            src = templates_src / tf
+            if src.exists():
+                atomic_copy(src, intent_templates_dir / tf)
+                template_copied += 1
+        if template_copied > 0:
+            tracker.complete("Supporting templates", f"Copied {template_copied} templates to .intent/templates/")
+
+        # Copy scripts to .intent/scripts/
+        scripts_src_dir = Path(__file__).parent.parent.parent / "scripts"
+        intent_scripts_dir = intent_dir / "scripts"
+        intent_scripts_dir.mkdir(exist_ok=True)
+
+        # Use the chosen script variant, falling back to the other one
+        preferred, fallback = ("bash", "powershell") if script_type == "sh" else ("powershell", "bash")
+        script_src_dir = scripts_src_dir / preferred
+        if not script_src_dir.exists():
+            script_src_dir = scripts_src_dir / fallback
+        script_copied = 0
+        if script_src_dir.exists():
+            for script_file in script_src_dir.glob("*"):
+                if script_file.is_file():
+                    atomic_copy(script_file, intent_scripts_dir / script_file.name)
+                    script_copied += 1
+            # Make scripts executable on Unix-like systems
+            if os.name != "nt":
+                for f in intent_scripts_dir.iterdir():
+                    if f.suffix in (".sh", ".ps1"):
+                        f.chmod(f.stat().st_mode | 0o111)
+        if script_copied > 0:
+            tracker.complete("Setup scripts", f"Copied {script_copied} scripts to .intent/scripts/")
 
     # Create enhanced-config.json
     enhanced_config_src = templates_src / ".intent" / "enhanced-config.json"
     if enhanced_config_src.exists():
-        shutil.copy(enhanced_config_src, intent_dir / "enhanced-config.json")
+        atomic_copy(enhanced_config_src, intent_dir / ENHANCED_CONFIG_NAME)
         tracker.complete("Enhanced config", "Created enhanced-config.json")
 
     # Create agent context file in .intent/
     agent_context_src = templates_src / "agent-file-template.md"
     if agent_context_src.exists():
-        shutil.copy(agent_context_src, intent_dir / "AGENTS.md")
+        atomic_copy(agent_context_src, intent_dir / "AGENTS.md")
         tracker.complete("Agent context", "Created AGENTS.md in .intent/")
 
     # Write .intent/.gitignore
-    gitignore_path = intent_dir / ".gitignore"
-    if not gitignore_path.exists():
-        gitignore_path.write_text("# Intent-generated files\n# Add overrides below:\n")
+    create_if_missing(intent_dir / ".gitignore", f"# Intent-generated files\n{WATCH_SOCKET_NAME}\n{STATE_LOCK_DIR_NAME}/\n# Add overrides below:\n", project_path)
 
     tracker.complete("Project initialization", f"Complete - ready for Intent-Driven Development with {agent_config['name']}")
 
@@ -738,5 +1196,1101 @@ def check():
     tracker.complete("System check", "Complete")
 
 
+# Workspace state shared by `intent watch` and `intent query`
+DEFAULT_SCAN_PATTERNS = ["**/*.md", "**/*.json", "**/*.yaml", "**/*.yml", "docs/**", "design/**", "specs/**"]
+DEFAULT_IGNORE_PATTERNS = ["**/node_modules/**", ".git/**", "dist/**", "build/**", "**/.DS_Store", f"{INTENT_DIR_NAME}/{STATE_LOCK_DIR_NAME}/**"]
+
+TASK_LINE_RE = re.compile(r"^\s*[-*]\s+\[(?P<done>[ xX])\]\s+(?P<id>T\d+)\b(?P<rest>.*)$")
+TASK_TAG_RE = re.compile(r"^\s*\[(?P<tag>[^\]]+)\]")
+TASK_PATH_RE = re.compile(r"\bin\s+`?((?:[\w.\-]+/)+[\w.\-]+)`?")
+TASK_DEPENDS_RE = re.compile(r"depends on\s+([^)]*)", re.IGNORECASE)
+TASK_ID_RE = re.compile(r"\bT\d+\b")
+
+
+def _load_enhanced_config(project_path: Path) -> dict:
+    """Return the parsed .intent/enhanced-config.json, or {} when missing or invalid."""
+    config_path = project_path / INTENT_DIR_NAME / ENHANCED_CONFIG_NAME
+    try:
+        return json.loads(config_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _config_section(config: dict, *keys: str) -> dict:
+    """Walk nested config keys, returning {} for any missing level."""
+    for key in keys:
+        config = config.get(key) if isinstance(config, dict) else None
+    return config if isinstance(config, dict) else {}
+
+
+def _matches_any(rel_path: str, patterns: list[str]) -> bool:
+    """Match a POSIX relative path against glob patterns, letting `**/` also match the top level."""
+    for pattern in patterns:
+        if fnmatch.fnmatch(rel_path, pattern):
+            return True
+        if pattern.startswith("**/") and fnmatch.fnmatch(rel_path, pattern[3:]):
+            return True
+    return False
+
+
+def _walk_workspace(root: Path, ignore_patterns: list[str], base: Path | None = None):
+    """Yield (directory, filenames) for every directory under root that is not ignored.
+
+    Ignore patterns are matched against paths relative to base (the project root),
+    which defaults to root itself.
+    """
+    base = root if base is None else base
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        rel_dir = current.relative_to(base).as_posix()
+        prefix = "" if rel_dir == "." else rel_dir + "/"
+        dirnames[:] = [d for d in dirnames if not _matches_any(f"{prefix}{d}/", ignore_patterns)]
+        yield current, [f for f in filenames if not _matches_any(prefix + f, ignore_patterns)]
+
+
+def classify_artifact(rel_path: str) -> str:
+    """Classify an artifact by path, mirroring enhanced-artifact-scanner.sh."""
+    if rel_path.endswith(".md"):
+        if "architecture" in rel_path:
+            return "architecture"
+        if "wireframe" in rel_path or "mockup" in rel_path:
+            return "wireframes"
+        if "api" in rel_path or "spec" in rel_path:
+            return "api-specs"
+        if "data" in rel_path or "model" in rel_path:
+            return "data-model"
+        return "documentation"
+    if rel_path.endswith((".json", ".yaml", ".yml")):
+        if "contract" in rel_path or "api" in rel_path:
+            return "contracts"
+        return "configuration"
+    return "unknown"
+
+
+def parse_tasks(text: str) -> list[dict]:
+    """Parse checklist lines of a tasks.md file into task dicts.
+
+    Understands the `[ID] [P?] [Story] [Priority] Description` format from
+    tasks-template.md, including `in <path>` file references and
+    `(depends on T001, T002)` annotations.
+    """
+    tasks = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        match = TASK_LINE_RE.match(line)
+        if not match:
+            continue
+        rest = match.group("rest")
+        parallel, story, priority = False, None, None
+        while tag_match := TASK_TAG_RE.match(rest):
+            tag = tag_match.group("tag").strip()
+            if tag == "P":
+                parallel = True
+            elif re.fullmatch(r"US\d+", tag):
+                story = tag
+            elif re.fullmatch(r"P\d+", tag):
+                priority = tag
+            else:
+                break
+            rest = rest[tag_match.end():]
+        description = rest.strip()
+        depends = []
+        for depends_match in TASK_DEPENDS_RE.finditer(description):
+            depends.extend(TASK_ID_RE.findall(depends_match.group(1)))
+        tasks.append({
+            "id": match.group("id"),
+            "done": match.group("done").lower() == "x",
+            "parallel": parallel,
+            "story": story,
+            "priority": priority,
+            "description": description,
+            "paths": [p.rstrip(".,;:") for p in TASK_PATH_RE.findall(description)],
+            "depends": depends,
+            "line": line_no,
+        })
+    return tasks
+
+
+def is_tasks_file(rel_path: str) -> bool:
+    """Return True for task lists (.intent/tasks.md, intents/<feature>/tasks.md), not command templates."""
+    parts = rel_path.split("/")
+    return parts[-1] == TASKS_FILE_NAME and parts[0] in (INTENT_DIR_NAME, "intents")
+
+
+def _find_dependency_cycles(tasks: list[dict]) -> list[list[str]]:
+    """Return dependency cycles among tasks, each as a list of task IDs."""
+    graph = {t["id"]: t["depends"] for t in tasks}
+    state: dict[str, int] = {}  # 1 = visiting, 2 = done
+    cycles = []
+
+    def visit(task_id: str, stack: list[str]):
+        state[task_id] = 1
+        stack.append(task_id)
+        for dep in graph.get(task_id, []):
+            if dep not in graph:
+                continue
+            if state.get(dep) == 1:
+                cycles.append(stack[stack.index(dep):] + [dep])
+            elif dep not in state:
+                visit(dep, stack)
+        stack.pop()
+        state[task_id] = 2
+
+    for task_id in graph:
+        if task_id not in state:
+            visit(task_id, [])
+    return cycles
+
+
+def validate_tasks(tasks: list[dict], project_path: Path, config: dict) -> list[dict]:
+    """Check a parsed task list against the task_quality and dependency_graph settings."""
+    validation = _config_section(config, "task_quality", "validation")
+    conflicts = _config_section(config, "enhanced_features", "dependency_graph", "conflict_detection")
+    issues = []
+
+    def issue(severity: str, task: dict, message: str):
+        issues.append({"severity": severity, "task": task["id"], "line": task["line"], "message": message})
+
+    by_id: dict[str, dict] = {}
+    for task in tasks:
+        if task["id"] in by_id:
+            issue("error", task, f"Duplicate task ID (first defined on line {by_id[task['id']]['line']})")
+        by_id.setdefault(task["id"], task)
+
+    for task in tasks:
+        if validation.get("require_file_paths", True) and not task["paths"]:
+            issue("warning", task, "No file path given (expected 'in <path>')")
+        if task["done"]:
+            for rel_path in task["paths"]:
+                if not (project_path / rel_path).exists():
+                    issue("warning", task, f"Completed task references missing file {rel_path}")
+        for dep in task["depends"]:
+            dep_task = by_id.get(dep)
+            if dep_task is None:
+                issue("error", task, f"Depends on unknown task {dep}")
+            elif task["done"] and not dep_task["done"] and conflicts.get("blocking_tasks", True):
+                issue("warning", task, f"Marked complete before its dependency {dep}")
+
+    if conflicts.get("circular_deps", True):
+        for cycle in _find_dependency_cycles(tasks):
+            issue("error", by_id[cycle[0]], "Circular dependency: " + " -> ".join(cycle))
+    return issues
+
+
+class WorkspaceState:
+    """Artifact index, task graphs and validation results for one project, kept warm in memory.
+
+    Every derived view is keyed by file so a change only recomputes what
+    depends on it: artifact entries for the touched paths, and the task graph
+    and validation of any tasks.md that changed or references a touched path.
+    """
+
+    def __init__(self, project_path: Path):
+        self.project_path = project_path.resolve()
+        self.config: dict = {}
+        self.scan_patterns: list[str] = DEFAULT_SCAN_PATTERNS
+        self.ignore_patterns: list[str] = DEFAULT_IGNORE_PATTERNS
+        self.artifacts: dict[str, dict] = {}
+        self.task_graphs: dict[str, list[dict]] = {}
+        self.validation: dict[str, list[dict]] = {}
+        self._referenced_by: dict[str, set[str]] = {}  # referenced path -> tasks files
+        self.generation = 0
+        self.updated_at = 0.0
+        self.watcher_backend = None
+        self._lock = threading.RLock()
+
+    def _rel(self, path: Path) -> Optional[str]:
+        try:
+            return Path(path).resolve().relative_to(self.project_path).as_posix()
+        except ValueError:
+            return None
+
+    def _load_config(self):
+        self.config = _load_enhanced_config(self.project_path)
+        discovery = _config_section(self.config, "artifact_support", "discovery")
+        self.scan_patterns = discovery.get("scan_patterns") or DEFAULT_SCAN_PATTERNS
+        validation = _config_section(self.config, "enhanced_features", "codebase_validation")
+        self.ignore_patterns = list(dict.fromkeys(DEFAULT_IGNORE_PATTERNS + (validation.get("ignore_patterns") or [])))
+
+    def _index_file(self, rel_path: str):
+        path = self.project_path / rel_path
+        try:
+            stat = path.stat()
+        except OSError:
+            self.artifacts.pop(rel_path, None)
+            return
+        if not path.is_file() or not _matches_any(rel_path, self.scan_patterns):
+            self.artifacts.pop(rel_path, None)
+            return
+        self.artifacts[rel_path] = {
+            "path": rel_path,
+            "type": classify_artifact(rel_path),
+            "size": stat.st_size,
+            "modified": stat.st_mtime,
+        }
+
+    def _drop_tasks_file(self, rel_path: str):
+        self.task_graphs.pop(rel_path, None)
+        self.validation.pop(rel_path, None)
+        for owners in self._referenced_by.values():
+            owners.discard(rel_path)
+
+    def _load_tasks_file(self, rel_path: str):
+        self._drop_tasks_file(rel_path)
+        try:
+            text = (self.project_path / rel_path).read_text(encoding="utf-8")
+        except OSError:
+            return
+        tasks = parse_tasks(text)
+        self.task_graphs[rel_path] = tasks
+        for task in tasks:
+            for ref in task["paths"]:
+                self._referenced_by.setdefault(ref, set()).add(rel_path)
+        self._validate_tasks_file(rel_path)
+
+    def _validate_tasks_file(self, rel_path: str):
+        tasks = self.task_graphs.get(rel_path)
+        if tasks is not None:
+            self.validation[rel_path] = validate_tasks(tasks, self.project_path, self.config)
+
+    def _bump(self):
+        self.generation += 1
+        self.updated_at = time.time()
+
+    def refresh_all(self):
+        """Rebuild every derived view from scratch."""
+        with self._lock:
+            self._load_config()
+            self.artifacts.clear()
+            self.task_graphs.clear()
+            self.validation.clear()
+            self._referenced_by.clear()
+            for directory, filenames in _walk_workspace(self.project_path, self.ignore_patterns):
+                for name in filenames:
+                    rel_path = (directory / name).relative_to(self.project_path).as_posix()
+                    self._index_file(rel_path)
+                    if is_tasks_file(rel_path):
+                        self._load_tasks_file(rel_path)
+            self._bump()
+
+    def apply_changes(self, paths: set[Path]):
+        """Recompute only the views affected by the given changed paths."""
+        with self._lock:
+            rel_paths = {r for r in (self._rel(p) for p in paths) if r is not None}
+            config_rel = f"{INTENT_DIR_NAME}/{ENHANCED_CONFIG_NAME}"
+            if "." in rel_paths or config_rel in rel_paths:
+                self.refresh_all()
+                return
+
+            # A created or moved-in directory stands for every file beneath it
+            for rel_path in list(rel_paths):
+                full_path = self.project_path / rel_path
+                if full_path.is_dir():
+                    rel_paths.discard(rel_path)
+                    for directory, filenames in _walk_workspace(full_path, self.ignore_patterns, self.project_path):
+                        rel_paths.update((directory / name).relative_to(self.project_path).as_posix() for name in filenames)
+
+            revalidate = set()
+            for rel_path in rel_paths:
+                if _matches_any(rel_path, self.ignore_patterns):
+                    continue
+                full_path = self.project_path / rel_path
+                if not full_path.exists():
+                    # Could be a removed directory: drop everything underneath it
+                    prefix = rel_path + "/"
+                    for stale in [a for a in self.artifacts if a.startswith(prefix)]:
+                        del self.artifacts[stale]
+                    for stale in [t for t in self.task_graphs if t.startswith(prefix)]:
+                        self._drop_tasks_file(stale)
+                    for ref, owners in self._referenced_by.items():
+                        if ref.startswith(prefix):
+                            revalidate |= owners
+                self._index_file(rel_path)
+                if is_tasks_file(rel_path):
+                    if full_path.is_file():
+                        self._load_tasks_file(rel_path)
+                    else:
+                        self._drop_tasks_file(rel_path)
+                revalidate |= self._referenced_by.get(rel_path, set())
+
+            for tasks_file in revalidate:
+                self._validate_tasks_file(tasks_file)
+            self._bump()
+
+    def snapshot(self, name: str) -> dict:
+        """Return a JSON-serializable view for a query name."""
+        with self._lock:
+            if name == "ping":
+                return {"pong": True}
+            if name == "status":
+                return {
+                    "project": str(self.project_path),
+                    "generation": self.generation,
+                    "updated_at": self.updated_at,
+                    "watcher": self.watcher_backend,
+                    "artifacts": len(self.artifacts),
+                    "tasks_files": len(self.task_graphs),
+                    "tasks": sum(len(t) for t in self.task_graphs.values()),
+                    "issues": sum(len(i) for i in self.validation.values()),
+                }
+            if name == "artifacts":
+                return {"artifacts": sorted(self.artifacts.values(), key=lambda a: a["path"])}
+            if name == "tasks":
+                return {"tasks": {k: list(v) for k, v in self.task_graphs.items()}}
+            if name == "validation":
+                return {"validation": {k: list(v) for k, v in self.validation.items()}}
+            raise KeyError(name)
+
+    def handle_query(self, line: str) -> bytes:
+        """Answer one request line (JSON `{"query": ...}` or a bare query name) with a JSON line."""
+        try:
+            request = json.loads(line) if line.startswith("{") else {"query": line}
+            name = request.get("query", "status")
+            response = {"ok": True, "query": name, "generation": self.generation, **self.snapshot(name)}
+        except KeyError as e:
+            response = {"ok": False, "error": f"Unknown query: {e.args[0]}"}
+        except (ValueError, AttributeError) as e:
+            response = {"ok": False, "error": f"Malformed request: {e}"}
+        return json.dumps(response).encode("utf-8") + b"\n"
+
+
+class _InotifyWatcher:
+    """Recursive directory watcher built on Linux inotify via ctypes."""
+
+    name = "inotify"
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, root: Path, ignore_patterns: list[str]):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self.root = root
+        self.ignore_patterns = ignore_patterns
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._watches: dict[int, Path] = {}
+        try:
+            self._add_tree(root)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def _add_tree(self, top: Path):
+        """Watch top and every non-ignored directory beneath it.
+
+        Raises OSError when a directory cannot be watched (e.g. ENOSPC at the
+        watch limit, or EACCES), since its changes would otherwise be missed.
+        """
+        for directory, _ in _walk_workspace(top, self.ignore_patterns, self.root):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOENT:
+                    continue  # removed while walking; its parent reports the deletion
+                raise OSError(err, f"cannot watch {directory}: {os.strerror(err)}")
+            self._watches[wd] = directory
+
+    def set_ignore_patterns(self, ignore_patterns: list[str]):
+        """Adopt reloaded ignore patterns, watching directories they no longer exclude."""
+        self.ignore_patterns = ignore_patterns
+        self._add_tree(self.root)
+
+    def poll(self, timeout: float) -> set[Path]:
+        """Wait up to timeout seconds and return the paths that changed."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & self.IN_Q_OVERFLOW:
+                    changed.add(self.root)  # events were lost; force a full rescan
+                    continue
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & self.IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+                path = directory / os.fsdecode(name) if name else directory
+                changed.add(path)
+                if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    rel_path = path.relative_to(self.root).as_posix() + "/"
+                    if not _matches_any(rel_path, self.ignore_patterns):
+                        self._add_tree(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _PollingWatcher:
+    """Portable fallback watcher that diffs stat snapshots at a fixed interval."""
+
+    name = "polling"
+
+    def __init__(self, root: Path, ignore_patterns: list[str], interval: float = 1.0):
+        self.root = root
+        self.ignore_patterns = ignore_patterns
+        self.interval = interval
+        self._snapshot = self._scan()
+        self._next_scan = time.monotonic() + interval
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        for directory, filenames in _walk_workspace(self.root, self.ignore_patterns):
+            for name in filenames:
+                path = directory / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout: float) -> set[Path]:
+        """Wait up to timeout seconds and return the paths that changed."""
+        time.sleep(max(0.0, min(timeout, self._next_scan - time.monotonic())))
+        if time.monotonic() < self._next_scan:
+            return set()
+        current = self._scan()
+        self._next_scan = time.monotonic() + self.interval
+        changed = {p for p in current.keys() | self._snapshot.keys() if current.get(p) != self._snapshot.get(p)}
+        self._snapshot = current
+        return changed
+
+    def set_ignore_patterns(self, ignore_patterns: list[str]):
+        """Adopt reloaded ignore patterns; the next scan reports newly included files."""
+        self.ignore_patterns = ignore_patterns
+
+    def close(self):
+        pass
+
+
+def _make_watcher(root: Path, ignore_patterns: list[str], force_polling: bool, poll_interval: float):
+    """Return an inotify watcher when available, otherwise a polling watcher."""
+    if not force_polling:
+        try:
+            return _InotifyWatcher(root, ignore_patterns)
+        except (OSError, AttributeError) as e:
+            console.print(f"[yellow]⚠️  inotify unavailable ({e}); falling back to polling[/yellow]")
+    return _PollingWatcher(root, ignore_patterns, poll_interval)
+
+
+def _default_socket_path(project_path: Path) -> Path:
+    return project_path / INTENT_DIR_NAME / WATCH_SOCKET_NAME
+
+
+def _start_query_server(state: WorkspaceState, socket_path: Path):
+    """Serve state queries over a Unix socket on a background thread."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix domain sockets are not supported on this platform")
+
+    if socket_path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()  # stale socket from a daemon that did not shut down cleanly
+        else:
+            raise OSError(f"Another watch daemon is already serving {socket_path}")
+        finally:
+            probe.close()
+
+    class QueryHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode("utf-8", "replace").strip()
+                if line:
+                    self.wfile.write(state.handle_query(line))
+                    self.wfile.flush()
+
+    class QueryServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    server = QueryServer(str(socket_path), QueryHandler)
+    threading.Thread(target=server.serve_forever, name="intent-watch-server", daemon=True).start()
+    return server
+
+
+@app.command()
+def watch(
+    project_path: str = typer.Argument(".", help="Project directory to watch"),
+    socket_path: str = typer.Option(None, "--socket", help="Unix socket to serve queries on (default: .intent/watch.sock)"),
+    debounce: float = typer.Option(0.25, "--debounce", help="Seconds of quiet before recomputing after a burst of changes"),
+    max_delay: float = typer.Option(2.0, "--max-delay", help="Upper bound in seconds on how long a continuous burst can postpone recomputation"),
+    poll: bool = typer.Option(False, "--poll", help="Use stat polling instead of inotify"),
+    poll_interval: float = typer.Option(1.0, "--poll-interval", help="Seconds between scans when polling"),
+):
+    """Keep the artifact index, task graph and validation results warm and serve them over a Unix socket."""
+    root = Path(project_path).resolve()
+    if not root.is_dir():
+        console.print(f"[red]❌ Project directory not found: {root}[/red]")
+        raise typer.Exit(1)
+
+    state = WorkspaceState(root)
+    started = time.monotonic()
+    state.refresh_all()
+    console.print(f"[green]✓[/green] Indexed {len(state.artifacts)} artifacts and {sum(len(t) for t in state.task_graphs.values())} tasks in {time.monotonic() - started:.2f}s")
+
+    sock_path = Path(socket_path).resolve() if socket_path else _default_socket_path(root)
+    try:
+        server = _start_query_server(state, sock_path)
+    except OSError as e:
+        console.print(f"[red]❌ Could not start query server: {e}[/red]")
+        raise typer.Exit(1)
+
+    watcher = _make_watcher(root, state.ignore_patterns, poll, poll_interval)
+    state.watcher_backend = watcher.name
+    console.print(f"[cyan]👀 Watching {root} ({watcher.name}); serving queries on {sock_path}[/cyan]")
+
+    def fall_back_to_polling(error: OSError):
+        # A directory could not be watched, so inotify would miss its changes
+        console.print(f"[yellow]⚠️  inotify failed ({error}); falling back to polling[/yellow]")
+        watcher.close()
+        fallback = _PollingWatcher(root, state.ignore_patterns, poll_interval)
+        state.watcher_backend = fallback.name
+        return fallback
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    pending: set[Path] = set()
+    burst_started = 0.0
+    try:
+        while not stop.is_set():
+            try:
+                changed = watcher.poll(debounce if pending else 0.5)
+            except OSError as e:
+                watcher = fall_back_to_polling(e)
+                changed = {root}  # events may have been dropped; rescan everything
+            changed.discard(sock_path)
+            if changed:
+                if not pending:
+                    burst_started = time.monotonic()
+                pending |= changed
+                if time.monotonic() - burst_started < max_delay:
+                    continue
+            if pending:
+                started = time.monotonic()
+                state.apply_changes(pending)
+                console.print(f"[dim]Recomputed {len(pending)} changed path(s) in {(time.monotonic() - started) * 1000:.1f}ms (generation {state.generation})[/dim]")
+                pending = set()
+                if watcher.ignore_patterns != state.ignore_patterns:
+                    try:
+                        watcher.set_ignore_patterns(state.ignore_patterns)
+                    except OSError as e:
+                        watcher = fall_back_to_polling(e)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+        watcher.close()
+        try:
+            sock_path.unlink()
+        except OSError:
+            pass
+    console.print("[yellow]Watch daemon stopped[/yellow]")
+
+
+@app.command()
+def query(
+    what: str = typer.Argument("status", help="Query to run: status, artifacts, tasks, validation or ping"),
+    project_path: str = typer.Option(".", "--path", help="Project directory the daemon is watching"),
+    socket_path: str = typer.Option(None, "--socket", help="Unix socket of the watch daemon (default: .intent/watch.sock)"),
+    timeout: float = typer.Option(5.0, "--timeout", help="Seconds to wait for the daemon to answer"),
+):
+    """Query a running `intent watch` daemon and print the JSON answer."""
+    sock_path = Path(socket_path).resolve() if socket_path else _default_socket_path(Path(project_path).resolve())
+    if not hasattr(socket, "AF_UNIX"):
+        console.print("[red]❌ Unix domain sockets are not supported on this platform[/red]")
+        raise typer.Exit(1)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(sock_path))
+            sock.sendall(json.dumps({"query": what}).encode("utf-8") + b"\n")
+            response = b""
+            while not response.endswith(b"\n"):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                response += chunk
+    except OSError as e:
+        console.print(f"[red]❌ No watch daemon reachable at {sock_path} ({e}). Start one with 'intent watch'.[/red]")
+        raise typer.Exit(1)
+
+    result = json.loads(response or b"{}")
+    typer.echo(json.dumps(result, indent=2))
+    if not result.get("ok"):
+        raise typer.Exit(1)
+
+
+# Selective CI test runner (`intent ci run`)
+ci_app = typer.Typer(help="Run CI/CD validation for completed tasks", add_completion=False)
+app.add_typer(ci_app, name="ci")
+
+# How each test_commands language recognizes sources, finds their tests and names targets
+CI_LANGUAGES = {
+    "python": {
+        "extensions": (".py",),
+        "test_file": re.compile(r"^(test_.*|.*_test)\.py$"),
+        "test_names": ("test_{stem}{ext}", "{stem}_test{ext}"),
+        "target": "path",
+        "parallel": True,
+        "shard_coverage": True,  # COVERAGE_FILE and --cov-report point each shard at its own report
+    },
+    "javascript": {
+        "extensions": (".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx"),
+        "test_file": re.compile(r"\.(test|spec)\.[cm]?[jt]sx?$"),
+        "test_names": ("{stem}.test{ext}", "{stem}.spec{ext}"),
+        "target": "path",
+        "parallel": True,
+        "shard_coverage": False,
+    },
+    "java": {
+        "extensions": (".java",),
+        "test_file": re.compile(r"Tests?\.java$"),
+        "test_names": ("{stem}Test{ext}", "{stem}Tests{ext}"),
+        "target": "class",
+        "parallel": False,  # concurrent mvn runs clobber target/
+        "shard_coverage": False,
+    },
+    "dotnet": {
+        "extensions": (".cs", ".fs", ".vb"),
+        "test_file": re.compile(r"Tests?\.(cs|fs|vb)$"),
+        "test_names": ("{stem}Tests{ext}", "{stem}Test{ext}"),
+        "target": "class",
+        "parallel": False,  # concurrent dotnet runs clobber bin/ and obj/
+        "shard_coverage": False,
+    },
+}
+
+COVERAGE_REPORT_CANDIDATES = [
+    "coverage.xml",
+    "coverage.json",
+    "coverage/coverage-summary.json",
+    "coverage/lcov.info",
+    "lcov.info",
+    "target/site/jacoco/jacoco.xml",
+    "build/reports/jacoco/test/jacocoTestReport.xml",
+]
+
+
+def completed_task_paths(project_path: Path, feature: Optional[str] = None) -> list[str]:
+    """Return the `in <path>` files of completed tasks, optionally limited to one feature."""
+    if feature:
+        tasks_files = [project_path / "intents" / feature / TASKS_FILE_NAME]
+    else:
+        tasks_files = [project_path / INTENT_DIR_NAME / TASKS_FILE_NAME]
+        tasks_files += sorted((project_path / "intents").glob(f"*/{TASKS_FILE_NAME}"))
+    paths: dict[str, None] = {}
+    for tasks_file in tasks_files:
+        try:
+            text = tasks_file.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        for task in parse_tasks(text):
+            if task["done"]:
+                paths.update(dict.fromkeys(task["paths"]))
+    return list(paths)
+
+
+def _ci_language(rel_path: str, languages: list[str]) -> Optional[str]:
+    suffix = Path(rel_path).suffix
+    for language in languages:
+        if suffix in CI_LANGUAGES.get(language, {}).get("extensions", ()):
+            return language
+    return None
+
+
+def select_test_targets(project_path: Path, changed_paths: list[str], languages: list[str], ignore_patterns: list[str]) -> tuple[dict[str, list[str]], list[str]]:
+    """Map changed files to the test files that cover them.
+
+    Test files map to themselves; sources map to sibling-named tests found
+    anywhere in the project (e.g. src/models/user.py -> tests/unit/test_user.py).
+    Returns ({language: [test paths]}, [changed files with no test]).
+    """
+    wanted = [(p, _ci_language(p, languages)) for p in changed_paths]
+    wanted = [(p, lang) for p, lang in wanted if lang]
+    if not wanted:
+        return {}, []
+
+    # One pass over the tree builds a filename -> paths index for every lookup below
+    by_name: dict[str, list[str]] = {}
+    for directory, filenames in _walk_workspace(project_path, ignore_patterns):
+        for name in filenames:
+            by_name.setdefault(name, []).append((directory / name).relative_to(project_path).as_posix())
+
+    targets: dict[str, dict[str, None]] = {}
+    untested = []
+    for rel_path, language in wanted:
+        spec = CI_LANGUAGES[language]
+        path = Path(rel_path)
+        if spec["test_file"].search(path.name):
+            found = [rel_path] if (project_path / rel_path).is_file() else []
+        else:
+            found = [
+                candidate
+                for pattern in spec["test_names"]
+                for candidate in by_name.get(pattern.format(stem=path.stem, ext=path.suffix), [])
+            ]
+        if found:
+            targets.setdefault(language, {}).update(dict.fromkeys(found))
+        else:
+            untested.append(rel_path)
+    return {language: list(paths) for language, paths in targets.items()}, untested
+
+
+def shard_test_targets(project_path: Path, targets: list[str], shard_count: int) -> list[list[str]]:
+    """Split targets into balanced shards, using file size as the cost estimate."""
+    def cost(rel_path: str) -> int:
+        try:
+            return (project_path / rel_path).stat().st_size
+        except OSError:
+            return 0
+
+    shards: list[list[str]] = [[] for _ in range(max(1, min(shard_count, len(targets))))]
+    loads = [0] * len(shards)
+    for rel_path in sorted(targets, key=cost, reverse=True):
+        lightest = loads.index(min(loads))
+        shards[lightest].append(rel_path)
+        loads[lightest] += cost(rel_path)
+    return [shard for shard in shards if shard]
+
+
+def _ci_shard_command(language: str, base_command: str, targets: list[str], report_dir: Optional[Path] = None) -> list[str]:
+    """Append targets to a test_commands entry in the form its runner expects.
+
+    With report_dir, a pytest-cov run writes its XML report there instead of
+    the project-wide path shared by every shard.
+    """
+    argv = shlex.split(base_command)
+    if report_dir is not None and any(arg.startswith("--cov") for arg in argv):
+        argv.append(f"--cov-report=xml:{report_dir / 'coverage.xml'}")
+    if CI_LANGUAGES[language]["target"] == "class":
+        names = [Path(t).stem for t in targets]
+        if language == "java":
+            return argv + [f"-Dtest={','.join(names)}"]
+        return argv + ["--filter", "|".join(f"FullyQualifiedName~{n}" for n in names)]
+    if argv and argv[0] == "npm" and "--" not in argv:
+        argv.append("--")
+    return argv + targets
+
+
+def _kill_process_tree(proc: subprocess.Popen):
+    try:
+        if os.name != "nt":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except OSError:
+        pass
+
+
+def _run_ci_shard(shard: dict, cwd: Path, timeout: float, running: dict, cancelled: threading.Event) -> dict:
+    """Run one shard in its own process group, killing the whole group on timeout.
+
+    The process is registered in `running` while it runs so an interrupted
+    run can kill it; shards that start after `cancelled` is set are skipped.
+    """
+    if cancelled.is_set():
+        return {**shard, "status": "cancelled", "output": "", "duration": 0.0}
+    started = time.monotonic()
+    try:
+        proc = subprocess.Popen(
+            shard["argv"],
+            cwd=cwd,
+            env={**os.environ, **shard["env"]} if shard.get("env") else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            start_new_session=os.name != "nt",
+        )
+    except OSError as e:
+        return {**shard, "status": "error", "output": str(e), "duration": 0.0}
+    running[shard["name"]] = proc
+    if cancelled.is_set():
+        _kill_process_tree(proc)  # interrupted while starting; the main thread may have missed it
+    try:
+        output, _ = proc.communicate(timeout=timeout)
+        status = "passed" if proc.returncode == 0 else "failed"
+    except subprocess.TimeoutExpired:
+        _kill_process_tree(proc)
+        output, _ = proc.communicate()
+        status = "timeout"
+    finally:
+        running.pop(shard["name"], None)
+    if cancelled.is_set():
+        status = "cancelled"
+    return {**shard, "status": status, "returncode": proc.returncode, "output": output or "", "duration": time.monotonic() - started}
+
+
+def read_coverage_percent(report_path: Path) -> Optional[float]:
+    """Return line coverage from a Cobertura/JaCoCo XML, coverage.py/Istanbul JSON or LCOV report."""
+    import xml.etree.ElementTree as ET
+
+    try:
+        if report_path.suffix == ".xml":
+            root = ET.parse(report_path).getroot()
+            if root.get("line-rate") is not None:
+                return float(root.get("line-rate")) * 100
+            for counter in root.findall("counter"):
+                if counter.get("type") == "LINE":
+                    covered, missed = int(counter.get("covered", 0)), int(counter.get("missed", 0))
+                    return 100.0 * covered / (covered + missed) if covered + missed else None
+            return None
+        if report_path.suffix == ".json":
+            data = json.loads(report_path.read_text(encoding="utf-8"))
+            if "totals" in data:
+                return float(data["totals"]["percent_covered"])
+            return float(data["total"]["lines"]["pct"])
+        found = hit = 0
+        for line in report_path.read_text(encoding="utf-8").splitlines():
+            if line.startswith("LF:"):
+                found += int(line[3:])
+            elif line.startswith("LH:"):
+                hit += int(line[3:])
+        return 100.0 * hit / found if found else None
+    except (OSError, ValueError, KeyError, TypeError, ET.ParseError):
+        return None
+
+
+def _coverage_lines(report_path: Path) -> Optional[dict[tuple[str, int], bool]]:
+    """Return {(file, line): hit} from a Cobertura XML or LCOV report, or None if unsupported."""
+    import xml.etree.ElementTree as ET
+
+    lines: dict[tuple[str, int], bool] = {}
+    try:
+        if report_path.suffix == ".xml":
+            root = ET.parse(report_path).getroot()
+            if root.get("line-rate") is None:
+                return None
+            for cls in root.iter("class"):
+                for line in cls.iter("line"):
+                    key = (cls.get("filename", ""), int(line.get("number", 0)))
+                    lines[key] = lines.get(key, False) or int(line.get("hits", 0)) > 0
+            return lines
+        source = ""
+        for line in report_path.read_text(encoding="utf-8").splitlines():
+            if line.startswith("SF:"):
+                source = line[3:]
+            elif line.startswith("DA:"):
+                number, hits = line[3:].split(",")[:2]
+                key = (source, int(number))
+                lines[key] = lines.get(key, False) or int(hits) > 0
+        return lines
+    except (OSError, ValueError, ET.ParseError):
+        return None
+
+
+def merge_coverage_percent(reports: list[Path]) -> Optional[float]:
+    """Return line coverage across shard reports, counting a line covered if any shard hit it."""
+    if len(reports) == 1:
+        return read_coverage_percent(reports[0])
+    merged: dict[tuple[str, int], bool] = {}
+    for report in reports:
+        lines = _coverage_lines(report)
+        if lines is None:
+            return None
+        for key, hit in lines.items():
+            merged[key] = merged.get(key, False) or hit
+    return 100.0 * sum(merged.values()) / len(merged) if merged else None
+
+
+def _find_coverage_reports(project_path: Path, since: float) -> list[Path]:
+    """Return the known coverage reports written after `since` (epoch seconds)."""
+    reports = []
+    for candidate in COVERAGE_REPORT_CANDIDATES:
+        path = project_path / candidate
+        try:
+            if path.stat().st_mtime >= since:
+                reports.append(path)
+        except OSError:
+            continue
+    return reports
+
+
+@ci_app.command("run")
+def ci_run(
+    project_path: str = typer.Option(".", "--path", help="Project directory"),
+    feature: str = typer.Option(None, "--feature", help="Only use tasks from intents/<feature>/tasks.md (defaults to INTENT_FEATURE)"),
+    jobs: int = typer.Option(os.cpu_count() or 1, "--jobs", "-j", help="Number of shards to run in parallel"),
+    timeout: float = typer.Option(600.0, "--timeout", help="Per-shard timeout in seconds"),
+    coverage_report: str = typer.Option(None, "--coverage-report", help="Coverage report to check against coverage_threshold (auto-detected when omitted)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show the selected shards without running them"),
+):
+    """Run only the tests affected by completed tasks, sharded across parallel processes."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    root = Path(project_path).resolve()
+    config = _load_enhanced_config(root)
+    cicd = _config_section(config, "enhanced_features", "cicd_integration")
+    if not cicd.get("enabled", False):
+        console.print("[yellow]CI/CD integration is disabled. Set enhanced_features.cicd_integration.enabled in .intent/enhanced-config.json.[/yellow]")
+        raise typer.Exit(0)
+
+    test_commands = cicd.get("test_commands") or {}
+    unknown = [lang for lang in test_commands if lang not in CI_LANGUAGES]
+    if unknown:
+        console.print(f"[yellow]⚠️  No test target mapping for: {', '.join(unknown)} (supported: {', '.join(CI_LANGUAGES)})[/yellow]")
+
+    feature = feature or os.getenv("INTENT_FEATURE")
+    changed = completed_task_paths(root, feature)
+    if not changed:
+        console.print("[yellow]No completed tasks with file paths found; nothing to test.[/yellow]")
+        raise typer.Exit(0)
+
+    ignore_patterns = DEFAULT_IGNORE_PATTERNS + (_config_section(config, "enhanced_features", "codebase_validation").get("ignore_patterns") or [])
+    targets, untested = select_test_targets(root, changed, list(test_commands), ignore_patterns)
+    for rel_path in untested:
+        console.print(f"[yellow]⚠️  No tests found for {rel_path}[/yellow]")
+
+    # Runners write coverage to a fixed path that parallel shards would overwrite. Python
+    # shards get their own data file and report, merged after the run; other languages
+    # (and an explicit --coverage-report) run as one shard so their report stays whole.
+    threshold = cicd.get("coverage_threshold")
+    measure_coverage = threshold is not None or coverage_report is not None
+    coverage_tmp = tempfile.TemporaryDirectory(prefix="intent-ci-") if threshold is not None and not coverage_report else None
+
+    shards = []
+    for language, language_targets in targets.items():
+        spec = CI_LANGUAGES[language]
+        per_shard_coverage = coverage_tmp is not None and spec["shard_coverage"]
+        shard_count = jobs if spec["parallel"] and (per_shard_coverage or not measure_coverage) else 1
+        for index, shard_targets in enumerate(shard_test_targets(root, language_targets, shard_count), start=1):
+            report_dir = Path(coverage_tmp.name) / f"{language}-{index}" if per_shard_coverage else None
+            if report_dir is not None:
+                report_dir.mkdir()
+            shards.append({
+                "name": f"{language}#{index}",
+                "targets": shard_targets,
+                "argv": _ci_shard_command(language, test_commands[language], shard_targets, report_dir),
+                "env": {"COVERAGE_FILE": str(report_dir / ".coverage")} if report_dir is not None else {},
+                "report_dir": report_dir,
+            })
+
+    console.print(f"[cyan]{len(changed)} changed file(s) -> {sum(len(t) for t in targets.values())} test target(s) in {len(shards)} shard(s)[/cyan]")
+    if dry_run:
+        for shard in shards:
+            console.print(f"  [bold]{shard['name']}[/bold] {shlex.join(shard['argv'])}")
+        if coverage_tmp is not None:
+            coverage_tmp.cleanup()
+        raise typer.Exit(0)
+
+    run_started = time.time()
+    failed = 0
+    if shards:
+        # Threads only wait on child processes; each shard runs as its own process
+        running: dict[str, subprocess.Popen] = {}
+        cancelled = threading.Event()
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            futures = [pool.submit(_run_ci_shard, shard, root, timeout, running, cancelled) for shard in shards]
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    style = {"passed": "green", "failed": "red", "timeout": "red", "error": "red", "cancelled": "yellow"}[result["status"]]
+                    console.print(f"[{style}]{result['status'].upper():>7}[/{style}] {result['name']} ({len(result['targets'])} target(s), {result['duration']:.1f}s)")
+                    if result["status"] != "passed":
+                        failed += 1
+                        tail = result["output"].strip().splitlines()[-40:]
+                        if tail:
+                            console.print(Panel(Text("\n".join(tail)), title=shlex.join(result["argv"]), border_style="red"))
+            except KeyboardInterrupt:
+                # Shards run in their own sessions, so Ctrl-C never reaches them
+                cancelled.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+                for proc in list(running.values()):
+                    _kill_process_tree(proc)
+                if coverage_tmp is not None:
+                    coverage_tmp.cleanup()
+                console.print("[red]❌ Interrupted; stopped all running shards[/red]")
+                raise typer.Exit(130)
+
+    checks: list[tuple[str, Optional[float]]] = []
+    if coverage_report:
+        report = Path(coverage_report).resolve()
+        checks.append((str(report), read_coverage_percent(report)))
+    elif threshold is not None and shards:
+        checks += [(str(report), read_coverage_percent(report)) for report in _find_coverage_reports(root, run_started)]
+        shard_reports = [shard["report_dir"] / "coverage.xml" for shard in shards if shard["report_dir"] is not None]
+        shard_reports = [report for report in shard_reports if report.is_file()]
+        if shard_reports:
+            checks.append((f"merged from {len(shard_reports)} shard report(s)", merge_coverage_percent(shard_reports)))
+        if not checks:
+            console.print(f"[yellow]⚠️  The test commands wrote no coverage report; skipping the {threshold}% threshold check (use --coverage-report to enforce it)[/yellow]")
+    if coverage_tmp is not None:
+        coverage_tmp.cleanup()
+
+    for label, percent in checks:
+        if percent is None:
+            console.print(f"[red]❌ Could not read coverage from {label}[/red]")
+            failed += 1
+        elif threshold is None:
+            console.print(f"[cyan]Coverage {percent:.1f}% ({label})[/cyan]")
+        elif percent < threshold:
+            console.print(f"[red]❌ Coverage {percent:.1f}% is below the {threshold}% threshold ({label})[/red]")
+            failed += 1
+        else:
+            console.print(f"[green]✓[/green] Coverage {percent:.1f}% meets the {threshold}% threshold ({label})")
+
+    if failed:
+        raise typer.Exit(1)
+    console.print("[green]✅ CI checks passed[/green]")
+
+
+# Safe artifact access for agents and hooks (`intent state`)
+state_app = typer.Typer(help="Read and write .intent/ artifacts safely from concurrent agents", add_completion=False)
+app.add_typer(state_app, name="state")
+
+
+@state_app.command("version")
+def state_version(path: str = typer.Argument(..., help="Artifact to inspect")):
+    """Print an artifact's version (sha256 of its content, or 'none' if missing)."""
+    try:
+        version = artifact_version(Path(path))
+    except OSError as e:
+        console.print(f"[red]❌ Could not read {path}: {e}[/red]")
+        raise typer.Exit(1)
+    typer.echo(version)
+
+
+@state_app.command("write")
+def state_write(
+    path: str = typer.Argument(..., help="Artifact to replace with stdin"),
+    expect: str = typer.Option(None, "--expect", help="Only write if the artifact is still at this version ('none' = must not exist)"),
+):
+    """Atomically replace an artifact with stdin under its lock and print the new version."""
+    try:
+        version = write_artifact(Path(path), sys.stdin.buffer.read(), expect)
+    except ArtifactConflictError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise typer.Exit(3)
+    typer.echo(version)
+
+
 def main():
     app()